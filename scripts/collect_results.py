@@ -4,28 +4,50 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import io
 import json
 import math
-from dataclasses import dataclass
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Tuple
 
-try:
-    import matplotlib
-    matplotlib.use("Agg")
+if TYPE_CHECKING:
     import matplotlib.pyplot as plt
-except ModuleNotFoundError as exc:
-    raise SystemExit("Matplotlib is required to build the heavy run report. Install it via 'pip install matplotlib'.") from exc
+else:
+    # Imported on first use by _ensure_matplotlib() so --no-figures runs skip it.
+    plt = None
 
 try:
     import numpy as np
 except ModuleNotFoundError as exc:
     raise SystemExit("NumPy is required to build the heavy run report. Install it via 'pip install numpy'.") from exc
 
-args: argparse.Namespace = argparse.Namespace(figures=Path("."))
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None  # type: ignore[assignment]
+
+# Benchmark payloads at least this large are streamed with ijson (if present).
+STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+PNG_DPI = 160
+# Below this many benchmark files, process start-up costs more than it saves.
+PROCESS_POOL_MIN_FILES = 16
+
+args: argparse.Namespace = argparse.Namespace(figures=Path("."), emit_svg=False)
+_FIGURE: Optional[plt.Figure] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchResult:
     name: str
     path: Path
@@ -35,7 +57,7 @@ class BenchResult:
     notes: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class AblationRow:
     plan: str
     metric: str
@@ -46,83 +68,223 @@ class AblationRow:
     notes: Optional[str] = None
 
 
+@dataclass(slots=True)
+class AssertionAcc:
+    passed: int = 0
+    failed: int = 0
+    metrics: List[float] = field(default_factory=list)
+    threshold: Any = None
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Optional[Any]:
+    try:
+        return _loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
 def load_json(path: Path) -> Optional[Any]:
+    # Payloads are shared between callers, which only ever read them.
+    return _read_json(path)
+
+
+def load_json_many(
+    paths: List[Path],
+    loader: Callable[[Path], Optional[Any]] = load_json,
+) -> List[Optional[Any]]:
+    """Load several JSON files concurrently, preserving the input order."""
+    if len(paths) < 2:
+        return [loader(path) for path in paths]
+    workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(loader, paths))
+
+
+def _load_json_skeleton(path: Path) -> Optional[Any]:
+    """Stream ``path`` with ijson, keeping objects and scalars but not array items.
+
+    ``extract_bench`` only inspects nested objects, so per-sample arrays are
+    not materialised. Empty arrays stay ``[]`` and non-empty ones become the
+    one-item ``[None]``, so truthiness and type match the full parse.
+    """
+    root: Any = None
+    stack: List[Dict[str, Any]] = []
+    key = ""
+    depth = 0
+    array_opened = False
+
+    def attach(value: Any) -> None:
+        nonlocal root
+        if stack:
+            stack[-1][key] = value
+        else:
+            root = value
+
     try:
-        with path.open("r", encoding="utf8") as handle:
-            return json.load(handle)
+        with path.open("rb") as handle:
+            for _, event, value in ijson.parse(handle, use_float=True):
+                if depth:
+                    if array_opened:
+                        array_opened = False
+                        if event != "end_array":
+                            # ``key`` is unchanged while items are skipped.
+                            attach([None])
+                    if event == "start_array":
+                        depth += 1
+                    elif event == "end_array":
+                        depth -= 1
+                    continue
+                if event == "map_key":
+                    key = value
+                elif event == "start_map":
+                    node: Dict[str, Any] = {}
+                    attach(node)
+                    stack.append(node)
+                elif event == "end_map":
+                    stack.pop()
+                elif event == "start_array":
+                    attach([])
+                    depth = 1
+                    array_opened = True
+                else:
+                    attach(value)
     except FileNotFoundError:
         return None
-    except json.JSONDecodeError:
+    except (ijson.JSONError, ValueError):
         return None
+    return root
+
+
+def load_bench_payload(path: Path) -> Optional[Any]:
+    if ijson is not None:
+        try:
+            large = path.stat().st_size >= STREAM_THRESHOLD_BYTES
+        except OSError:
+            large = False
+        if large:
+            return _load_json_skeleton(path)
+    # Bench payloads are read once each, so keep them out of the load_json cache.
+    return _read_json(path)
+
+
+def scan_files(root: Path, pattern: str = "*.json") -> List[Path]:
+    """Recursively list files below ``root`` whose name matches ``pattern``.
+
+    Uses one ``os.scandir`` per directory so the cached ``DirEntry`` type
+    information replaces the per-path ``stat`` calls of ``Path.glob``. Like
+    ``glob("**")``, symlinked directories are not descended into.
+    """
+    found: List[Path] = []
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    found.sort()
+    return found
 
 
 def as_float(value: Any) -> Optional[float]:
-    try:
-        if isinstance(value, bool):
-            return float(value)
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                return None
+    # Exact type checks cover the common JSON number and string cases; the
+    # isinstance fallback handles bool and other numeric subclasses.
+    kind = type(value)
+    if kind is float:
+        return value
+    if kind is int:
+        return float(value)
+    if kind is str:
+        stripped = value.strip()
+        if not stripped:
+            return None
+        try:
             return float(stripped)
-    except (TypeError, ValueError):
-        return None
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)):
+        return float(value)
     return None
 
 
+_THROUGHPUT_KEYS = (
+    "samples_per_second",
+    "jobs_per_second",
+    "throughput",
+    "items_per_second",
+    "per_second",
+)
+_RUNTIME_KEYS = (
+    "seconds",
+    "duration_seconds",
+    "total_seconds",
+)
+
+
 def _find_numeric(data: Any, keys: Iterable[str]) -> Optional[Tuple[str, float]]:
-    if isinstance(data, dict):
-        for key in keys:
-            value = data.get(key)
+    ordered = tuple(keys)
+    # Depth-first pre-order walk; children are pushed in reverse so siblings
+    # are visited in insertion order.
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        for key in ordered:
+            value = node.get(key)
             if isinstance(value, (int, float)) and not math.isnan(float(value)):
                 return key, float(value)
-        for value in data.values():
-            result = _find_numeric(value, keys)
-            if result is not None:
-                return result
+        stack.extend(value for value in reversed(node.values()) if isinstance(value, dict))
     return None
 
 
 def extract_bench(name: str, path: Path, payload: Any) -> BenchResult:
+    if not isinstance(payload, dict):
+        return BenchResult(name=name, path=path, throughput=None, throughput_unit=None, runtime_seconds=None, notes=None)
+
     throughput = None
     unit = None
     runtime = None
-    notes = None
-
-    if isinstance(payload, dict):
-        if "notes" in payload and isinstance(payload["notes"], str):
-            notes = payload["notes"].strip()
-        if {
-            "jobs",
-            "seconds",
-        }.issubset(payload.keys()):
-            seconds = float(payload.get("seconds", 0.0) or 0.0)
-            jobs = float(payload.get("jobs", 0.0) or 0.0)
-            if seconds > 0.0:
-                throughput = jobs / seconds
-                unit = "jobs/s"
-                runtime = seconds
-        if throughput is None:
-            result = _find_numeric(payload, [
-                "samples_per_second",
-                "jobs_per_second",
-                "throughput",
-                "items_per_second",
-                "per_second",
-            ])
-            if result is not None:
-                _, throughput = result
-                unit = "ops/s"
-        if runtime is None:
-            result = _find_numeric(payload, [
-                "seconds",
-                "duration_seconds",
-                "total_seconds",
-            ])
-            if result is not None:
-                _, runtime = result
+    notes = payload.get("notes")
+    notes = notes.strip() if isinstance(notes, str) else None
+
+    if "jobs" in payload and "seconds" in payload:
+        try:
+            seconds = float(payload["seconds"] or 0.0)
+            jobs = float(payload["jobs"] or 0.0)
+        except (TypeError, ValueError):
+            # Malformed counters: fall back to the nested key search below.
+            seconds = 0.0
+        if seconds > 0.0:
+            throughput = jobs / seconds
+            unit = "jobs/s"
+            runtime = seconds
+    if throughput is None:
+        result = _find_numeric(payload, _THROUGHPUT_KEYS)
+        if result is not None:
+            _, throughput = result
+            unit = "ops/s"
+    if runtime is None:
+        result = _find_numeric(payload, _RUNTIME_KEYS)
+        if result is not None:
+            _, runtime = result
     return BenchResult(
         name=name,
         path=path,
@@ -133,38 +295,117 @@ def extract_bench(name: str, path: Path, payload: Any) -> BenchResult:
     )
 
 
+def _bench_from_payload(artifacts: Path, path: Path, payload: Any) -> BenchResult:
+    rel = path.relative_to(artifacts)
+    return extract_bench(str(rel.with_suffix("")), rel, payload)
+
+
+def _bench_from_file(artifacts: Path, path: Path) -> BenchResult:
+    return _bench_from_payload(artifacts, path, load_bench_payload(path))
+
+
+def collect_bench_results(artifacts: Path, paths: List[Path]) -> List[BenchResult]:
+    """Parse benchmark snapshots, fanning out to worker processes for large runs.
+
+    Small runs stay in-process and only overlap file reads on threads.
+    """
+    if len(paths) >= PROCESS_POOL_MIN_FILES:
+        try:
+            executor = ProcessPoolExecutor()
+        except (OSError, NotImplementedError):
+            # Sandboxed hosts may refuse the semaphores a process pool needs.
+            executor = None
+        if executor is not None:
+            # Errors raised by the work itself propagate instead of triggering a serial rerun.
+            with executor:
+                return list(executor.map(partial(_bench_from_file, artifacts), paths, chunksize=32))
+    payloads = load_json_many(paths, load_bench_payload)
+    return [_bench_from_payload(artifacts, path, payload) for path, payload in zip(paths, payloads)]
+
+
 def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save_figure(fig: plt.Figure, out_dir: Path, stem: str) -> Tuple[Path, Path]:
+def _ensure_matplotlib() -> None:
+    global plt
+    if plt is not None:
+        return
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as pyplot
+    except ModuleNotFoundError as exc:
+        raise SystemExit("Matplotlib is required to build the heavy run report. Install it via 'pip install matplotlib'.") from exc
+    pyplot.rcParams.update({
+        "figure.autolayout": False,
+        # DejaVu Sans ships with Matplotlib, so findfont never scans system fonts.
+        "font.family": "DejaVu Sans",
+        "axes.unicode_minus": False,
+        "svg.fonttype": "none",
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+    })
+    plt = pyplot
+
+
+def reset_figure(figsize: Tuple[float, float]) -> plt.Figure:
+    """Return the shared report figure, cleared and resized for the next plot."""
+    global _FIGURE
+    if _FIGURE is None:
+        _ensure_matplotlib()
+        # Created at the PNG resolution so save_figure can print the canvas as-is.
+        _FIGURE = plt.figure(dpi=PNG_DPI)
+    _FIGURE.clear()
+    _FIGURE.set_size_inches(figsize)
+    return _FIGURE
+
+
+def save_figure(fig: plt.Figure, out_dir: Path, stem: str) -> Tuple[Path, Optional[Path]]:
     ensure_directory(out_dir)
     png_path = out_dir / f"{stem}.png"
-    svg_path = out_dir / f"{stem}.svg"
-    fig.savefig(png_path, bbox_inches="tight", dpi=160)
-    fig.savefig(svg_path, bbox_inches="tight")
-    plt.close(fig)
+    svg_path = None
+    fig.tight_layout()
+    with png_path.open("wb") as handle:
+        fig.canvas.print_png(handle)
+    if args.emit_svg:
+        svg_path = out_dir / f"{stem}.svg"
+        fig.savefig(svg_path)
     return png_path, svg_path
 
 
-def histogram_midpoints(edges: List[float]) -> List[float]:
-    return [0.5 * (edges[idx] + edges[idx + 1]) for idx in range(len(edges) - 1)]
+def histogram_midpoints(edges: np.ndarray) -> np.ndarray:
+    return 0.5 * (edges[:-1] + edges[1:])
 
 
-def build_cest_fig(histogram: Dict[str, Any]) -> Optional[Tuple[Path, Path]]:
+def _histogram_arrays(histogram: Dict[str, Any]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
     edges = histogram.get("edges", []) if isinstance(histogram, dict) else []
     counts = histogram.get("counts", []) if isinstance(histogram, dict) else []
     if not edges or not counts:
         return None
-    total = float(sum(counts)) or 1.0
+    # Single precision is ample for 160 DPI output and halves the array traffic.
+    return np.asarray(edges, dtype=np.float32), np.asarray(counts, dtype=np.float32)
+
+
+def _draw_hist(ax: plt.Axes, name: str, edges: np.ndarray, counts: np.ndarray, color: str) -> None:
+    # One filled step path instead of a Rectangle patch per bin.
+    ax.stairs(counts, edges, fill=True, edgecolor="#333333", facecolor=color, linewidth=1.0)
+    ax.set_xlabel(name)
+    ax.set_ylabel("count")
+    ax.set_title(f"{name} histogram")
+
+
+def build_cest_fig(histogram: Dict[str, Any]) -> Optional[Tuple[Path, Optional[Path]]]:
+    arrays = _histogram_arrays(histogram)
+    if arrays is None:
+        return None
+    edges, counts = arrays
+    total = float(counts.sum(dtype=np.float64)) or 1.0
     mids = histogram_midpoints(edges)
-    cumulative = np.cumsum(counts) / total
-    fig, (ax_hist, ax_ecdf) = plt.subplots(1, 2, figsize=(10, 4))
-    widths = [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
-    ax_hist.bar(edges[:-1], counts, width=widths, align="edge", edgecolor="#333333", color="#4472c4")
-    ax_hist.set_xlabel("c_est")
-    ax_hist.set_ylabel("count")
-    ax_hist.set_title("c_est histogram")
+    cumulative = np.cumsum(counts, dtype=np.float32) / np.float32(total)
+    fig = reset_figure((10, 4))
+    ax_hist, ax_ecdf = fig.subplots(1, 2)
+    _draw_hist(ax_hist, "c_est", edges, counts, "#4472c4")
     ax_ecdf.step(mids, cumulative, where="post", color="#ed7d31")
     ax_ecdf.set_xlabel("c_est")
     ax_ecdf.set_ylabel("ECDF")
@@ -173,25 +414,23 @@ def build_cest_fig(histogram: Dict[str, Any]) -> Optional[Tuple[Path, Path]]:
     return save_figure(fig, args.figures, "c_est_distribution")
 
 
-def build_hist_fig(name: str, histogram: Dict[str, Any]) -> Optional[Tuple[Path, Path]]:
-    edges = histogram.get("edges", []) if isinstance(histogram, dict) else []
-    counts = histogram.get("counts", []) if isinstance(histogram, dict) else []
-    if not edges or not counts:
+def build_hist_fig(name: str, histogram: Dict[str, Any]) -> Optional[Tuple[Path, Optional[Path]]]:
+    arrays = _histogram_arrays(histogram)
+    if arrays is None:
         return None
-    fig, ax = plt.subplots(figsize=(6, 4))
-    widths = [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
-    ax.bar(edges[:-1], counts, width=widths, align="edge", edgecolor="#333333", color="#6aabd2")
-    ax.set_xlabel(name)
-    ax.set_ylabel("count")
-    ax.set_title(f"{name} histogram")
+    edges, counts = arrays
+    fig = reset_figure((6, 4))
+    ax = fig.add_subplot()
+    _draw_hist(ax, name, edges, counts, "#6aabd2")
     return save_figure(fig, args.figures, f"{name}_histogram")
 
 
-def build_pass_rate_fig(rate: Optional[float]) -> Optional[Tuple[Path, Path]]:
+def build_pass_rate_fig(rate: Optional[float]) -> Optional[Tuple[Path, Optional[Path]]]:
     if rate is None:
         return None
     rate = max(0.0, min(1.0, rate))
-    fig, ax = plt.subplots(figsize=(4, 4))
+    fig = reset_figure((4, 4))
+    ax = fig.add_subplot()
     ax.bar(["pass"], [rate * 100.0], color="#70ad47")
     ax.set_ylim(0.0, 100.0)
     ax.set_ylabel("Pass rate (%)")
@@ -199,14 +438,15 @@ def build_pass_rate_fig(rate: Optional[float]) -> Optional[Tuple[Path, Path]]:
     return save_figure(fig, args.figures, "pass_rate")
 
 
-def build_bench_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Path]]:
+def build_bench_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Optional[Path]]]:
     entries = [res for res in results if res.throughput is not None]
     if not entries:
         return None
     entries.sort(key=lambda item: item.throughput or 0.0, reverse=True)
     names = [res.name for res in entries]
     values = [res.throughput for res in entries]
-    fig, ax = plt.subplots(figsize=(8, 4 + 0.3 * len(entries)))
+    fig = reset_figure((8, 4 + 0.3 * len(entries)))
+    ax = fig.add_subplot()
     ax.barh(names, values, color="#5b9bd5")
     ax.invert_yaxis()
     ax.set_xlabel(entries[0].throughput_unit or "ops/s")
@@ -214,14 +454,15 @@ def build_bench_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Path]]:
     return save_figure(fig, args.figures, "benchmark_throughput")
 
 
-def build_runtime_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Path]]:
+def build_runtime_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Optional[Path]]]:
     entries = [res for res in results if res.runtime_seconds is not None]
     if not entries:
         return None
     entries.sort(key=lambda item: item.runtime_seconds or 0.0, reverse=True)
     names = [res.name for res in entries]
     values = [res.runtime_seconds for res in entries]
-    fig, ax = plt.subplots(figsize=(8, 4 + 0.3 * len(entries)))
+    fig = reset_figure((8, 4 + 0.3 * len(entries)))
+    ax = fig.add_subplot()
     ax.barh(names, values, color="#ffc000")
     ax.invert_yaxis()
     ax.set_xlabel("seconds")
@@ -229,13 +470,14 @@ def build_runtime_fig(results: List[BenchResult]) -> Optional[Tuple[Path, Path]]
     return save_figure(fig, args.figures, "benchmark_runtime")
 
 
-def build_assertion_fig(summary: Dict[str, Dict[str, Any]]) -> Optional[Tuple[Path, Path]]:
+def build_assertion_fig(summary: Dict[str, AssertionAcc]) -> Optional[Tuple[Path, Optional[Path]]]:
     if not summary:
         return None
     names = sorted(summary.keys())
-    passes = [summary[name]["pass"] for name in names]
-    fails = [summary[name]["fail"] for name in names]
-    fig, ax = plt.subplots(figsize=(8, 4 + 0.35 * len(names)))
+    passes = [summary[name].passed for name in names]
+    fails = [summary[name].failed for name in names]
+    fig = reset_figure((8, 4 + 0.35 * len(names)))
+    ax = fig.add_subplot()
     ax.barh(names, passes, color="#70ad47", label="pass")
     ax.barh(names, fails, left=passes, color="#c00000", label="fail")
     ax.invert_yaxis()
@@ -245,12 +487,25 @@ def build_assertion_fig(summary: Dict[str, Dict[str, Any]]) -> Optional[Tuple[Pa
     return save_figure(fig, args.figures, "assertions_outcome")
 
 
+_ENV_ROW = "| {} | {} |".format
+_BENCH_ROW = "| {} | {} | {} | {} |".format
+_ABLATION_ROW = "| {} | {} | {} | {} | {} | {} |".format
+
+
+@lru_cache(maxsize=256)
+def _fmt_fixed(value: float, digits: int) -> str:
+    return f"{value:.{digits}f}"
+
+
 def fmt_float(value: Optional[float], digits: int = 3) -> str:
     if value is None:
         return "—"
     if math.isnan(value):
         return "NaN"
-    return f"{value:.{digits}f}"
+    if not value:
+        # -0.0 == 0.0 would share a cache slot, so zeros keep their own sign here.
+        return f"{value:.{digits}f}"
+    return _fmt_fixed(value, digits)
 
 
 def build_env_table(env: Dict[str, Any]) -> str:
@@ -277,24 +532,25 @@ def build_env_table(env: Dict[str, Any]) -> str:
         ("Concurrency", env.get("concurrency")),
     ]
     header = "| Field | Value |\n| --- | --- |"
-    body = "\n".join(f"| {field} | {value if value is not None else '—'} |" for field, value in rows)
+    body = "\n".join(_ENV_ROW(field, "—" if value is None else value) for field, value in rows)
     return f"{header}\n{body}"
 
 
-def summarize_assertions(index_path: Path) -> Tuple[Dict[str, Dict[str, Any]], int]:
-    summary: Dict[str, Dict[str, Any]] = {}
+def summarize_assertions(index_path: Path) -> Tuple[Dict[str, AssertionAcc], int]:
+    summary: DefaultDict[str, AssertionAcc] = defaultdict(AssertionAcc)
     total_reports = 0
     index_data = load_json(index_path)
     if not isinstance(index_data, list):
-        return summary, total_reports
+        return {}, total_reports
+    report_paths: List[Path] = []
     for entry in index_data:
         if not isinstance(entry, dict):
             continue
         rel = entry.get("report")
         if not isinstance(rel, str):
             continue
-        report_path = index_path.parent / rel
-        payload = load_json(report_path)
+        report_paths.append(index_path.parent / rel)
+    for payload in load_json_many(report_paths):
         if not isinstance(payload, dict):
             continue
         checks = payload.get("checks", [])
@@ -307,32 +563,31 @@ def summarize_assertions(index_path: Path) -> Tuple[Dict[str, Dict[str, Any]], i
             name = check.get("name")
             if not isinstance(name, str):
                 continue
-            passed = bool(check.get("pass"))
-            metric = check.get("metric")
-            threshold = check.get("threshold") or check.get("range")
-            record = summary.setdefault(name, {"pass": 0, "fail": 0, "metrics": []})
-            if passed:
-                record["pass"] += 1
+            record = summary[name]
+            if check.get("pass"):
+                record.passed += 1
             else:
-                record["fail"] += 1
+                record.failed += 1
+            metric = check.get("metric")
             if isinstance(metric, (int, float)):
-                record["metrics"].append(float(metric))
-            if threshold is not None:
-                record.setdefault("threshold", threshold)
-    return summary, total_reports
+                record.metrics.append(float(metric))
+            if record.threshold is None:
+                record.threshold = check.get("threshold") or check.get("range")
+    return dict(summary), total_reports
 
 
 def build_bench_table(results: List[BenchResult]) -> str:
     header = "| Benchmark | Throughput | Runtime (s) | Notes |\n| --- | --- | --- | --- |"
     lines = []
     for res in sorted(results, key=lambda item: item.name):
-        throughput = (
-            f"{res.throughput:.3f} {res.throughput_unit}" if res.throughput is not None and res.throughput_unit else
-            (f"{res.throughput:.3f}" if res.throughput is not None else "—")
-        )
-        runtime = f"{res.runtime_seconds:.3f}" if res.runtime_seconds is not None else "—"
-        note = res.notes or ""
-        lines.append(f"| {res.name} | {throughput} | {runtime} | {note} |")
+        if res.throughput is None:
+            throughput = "—"
+        elif res.throughput_unit:
+            throughput = f"{res.throughput:.3f} {res.throughput_unit}"
+        else:
+            throughput = f"{res.throughput:.3f}"
+        runtime = "—" if res.runtime_seconds is None else f"{res.runtime_seconds:.3f}"
+        lines.append(_BENCH_ROW(res.name, throughput, runtime, res.notes or ""))
     return "\n".join([header] + lines) if lines else "No benchmark artefacts were detected."
 
 
@@ -372,6 +627,16 @@ def _merge_notes(existing: Optional[str], addition: Optional[str]) -> Optional[s
     return "; ".join(sorted(parts)) if parts else existing
 
 
+def _join_notes(notes: List[str]) -> Optional[str]:
+    """Combine note strings exactly as repeated ``_merge_notes`` calls would."""
+    if not notes:
+        return None
+    if len(notes) == 1:
+        return notes[0]
+    parts = {part.strip() for note in notes for part in note.split("; ") if part.strip()}
+    return "; ".join(sorted(parts)) if parts else notes[0]
+
+
 def _normalise_plan_name(path: Path, payload: Dict[str, Any]) -> str:
     for key in ("plan", "plan_name", "name"):
         value = payload.get(key)
@@ -386,6 +651,13 @@ def _normalise_metric_name(name: Any) -> Optional[str]:
     return None
 
 
+def _reduce_values(values: Iterable[Any]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    numeric = [val for val in map(as_float, values) if val is not None]
+    if not numeric:
+        return None, None, None
+    return sum(numeric) / len(numeric), min(numeric), max(numeric)
+
+
 def _rows_from_kpis(path: Path, plan: str, kpis: Dict[str, Any]) -> List[AblationRow]:
     rows: List[AblationRow] = []
     for metric_name, payload in kpis.items():
@@ -400,12 +672,7 @@ def _rows_from_kpis(path: Path, plan: str, kpis: Dict[str, Any]) -> List[Ablatio
 
         if isinstance(payload, dict):
             if "values" in payload and isinstance(payload["values"], list):
-                values = [as_float(item) for item in payload["values"]]
-                numeric = [val for val in values if val is not None]
-                if numeric:
-                    mean = sum(numeric) / len(numeric)
-                    minimum = min(numeric)
-                    maximum = max(numeric)
+                mean, minimum, maximum = _reduce_values(payload["values"])
             if mean is None:
                 mean = as_float(payload.get("mean"))
             if minimum is None:
@@ -421,12 +688,7 @@ def _rows_from_kpis(path: Path, plan: str, kpis: Dict[str, Any]) -> List[Ablatio
             elif payload.get("all_pass") is False:
                 notes = _merge_notes(notes, "failures observed")
         elif isinstance(payload, list):
-            numeric = [as_float(item) for item in payload]
-            clean = [val for val in numeric if val is not None]
-            if clean:
-                mean = sum(clean) / len(clean)
-                minimum = min(clean)
-                maximum = max(clean)
+            mean, minimum, maximum = _reduce_values(payload)
         elif isinstance(payload, (int, float)):
             mean = float(payload)
 
@@ -472,7 +734,10 @@ def _rows_from_registry_entries(entries: Iterable[Dict[str, Any]]) -> List[Ablat
 
 
 def parse_ablation_file(path: Path) -> List[AblationRow]:
-    payload = load_json(path)
+    return parse_ablation_payload(path, load_json(path))
+
+
+def parse_ablation_payload(path: Path, payload: Any) -> List[AblationRow]:
     if not isinstance(payload, dict):
         if isinstance(payload, list):
             return _rows_from_registry_entries(payload)  # type: ignore[arg-type]
@@ -491,7 +756,7 @@ def parse_ablation_file(path: Path) -> List[AblationRow]:
 
 def discover_ablation_rows(artifacts: Path) -> List[AblationRow]:
     candidates: List[Path] = []
-    seen: set[Path] = set()
+    seen: set[Tuple[int, int]] = set()
     search_roots = [
         artifacts / "ablations",
         artifacts / "runs" / "ablations",
@@ -500,23 +765,32 @@ def discover_ablation_rows(artifacts: Path) -> List[AblationRow]:
         artifacts / "replication" / "ablations",
     ]
     for root in search_roots:
-        if root.is_file() and root.suffix.lower() == ".json":
+        if root.suffix.lower() == ".json" and root.is_file():
             candidates.append(root)
-        elif root.is_dir():
-            for path in root.glob("**/*.json"):
-                candidates.append(path)
+        else:
+            candidates.extend(scan_files(root))
     if not candidates:
-        for path in artifacts.glob("**/*ablation*.json"):
-            if path.is_file():
-                candidates.append(path)
-    rows: Dict[Tuple[str, str], AblationRow] = {}
+        candidates.extend(scan_files(artifacts, "*ablation*.json"))
+    unique: List[Path] = []
     for candidate in candidates:
-        resolved = candidate.resolve()
-        if resolved in seen:
+        # (st_dev, st_ino) identifies the file behind any symlink with a
+        # single stat, which is cheaper than resolving the full path.
+        try:
+            stat = os.stat(candidate)
+        except OSError:
             continue
-        seen.add(resolved)
-        for row in parse_ablation_file(candidate):
+        identity = (stat.st_dev, stat.st_ino)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        unique.append(candidate)
+    rows: Dict[Tuple[str, str], AblationRow] = {}
+    notes: Dict[Tuple[str, str], List[str]] = {}
+    for candidate, payload in zip(unique, load_json_many(unique)):
+        for row in parse_ablation_payload(candidate, payload):
             key = (row.plan, row.metric)
+            if row.notes:
+                notes.setdefault(key, []).append(row.notes)
             existing = rows.get(key)
             if existing is None:
                 rows[key] = row
@@ -529,7 +803,10 @@ def discover_ablation_rows(artifacts: Path) -> List[AblationRow]:
                 existing.minimum = row.minimum
             if existing.maximum is None:
                 existing.maximum = row.maximum
-            existing.notes = _merge_notes(existing.notes, row.notes)
+    # Notes are split, de-duplicated and joined once per key rather than on
+    # every merge.
+    for key, collected in notes.items():
+        rows[key].notes = _join_notes(collected)
     return sorted(rows.values(), key=lambda item: (item.plan, item.metric))
 
 
@@ -539,58 +816,77 @@ def build_ablation_table(rows: List[AblationRow]) -> str:
     header = "| Plan | Metric | Mean | Pass rate | Range | Notes |\n| --- | --- | --- | --- | --- | --- |"
     body = []
     for row in rows:
-        mean = fmt_float(row.mean) if row.mean is not None else "—"
-        pass_rate = f"{row.pass_rate * 100.0:.1f}%" if row.pass_rate is not None else "—"
+        # fmt_float already renders None as "—" and keeps NaN distinguishable.
+        pass_rate = "—" if row.pass_rate is None else f"{row.pass_rate * 100.0:.1f}%"
         if row.minimum is not None or row.maximum is not None:
-            lo = fmt_float(row.minimum) if row.minimum is not None else "—"
-            hi = fmt_float(row.maximum) if row.maximum is not None else "—"
-            rng = f"[{lo}, {hi}]"
+            rng = f"[{fmt_float(row.minimum)}, {fmt_float(row.maximum)}]"
         else:
             rng = "—"
-        notes = row.notes or ""
-        body.append(f"| {row.plan} | {row.metric} | {mean} | {pass_rate} | {rng} | {notes} |")
+        body.append(_ABLATION_ROW(row.plan, row.metric, fmt_float(row.mean), pass_rate, rng, row.notes or ""))
     return "\n".join([header] + body)
 
 
+def write_figure_links(
+    report: io.StringIO,
+    out_dir: Path,
+    figures: Iterable[Tuple[str, Optional[Tuple[Path, Optional[Path]]]]],
+) -> None:
+    """Embed each rendered figure's PNG, skipping figures that were not drawn."""
+    for caption, fig in figures:
+        if not fig:
+            continue
+        rel = fig[0].relative_to(out_dir)
+        print(file=report)
+        print(f"![{caption}]({rel})", file=report)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Collate heavy run results")
     parser.add_argument("--in", dest="artifacts", required=True, help="Directory containing collected artefacts")
     parser.add_argument("--out", dest="out", required=True, help="Run output directory")
+    parser.add_argument(
+        "--emit-svg",
+        action="store_true",
+        default=os.environ.get("ASM_REPORT_SVG") == "1",
+        help="Also write an SVG copy of every figure (default: PNG only, or ASM_REPORT_SVG=1)",
+    )
+    parser.add_argument(
+        "--no-figures",
+        action="store_true",
+        help="Skip chart rendering (and the Matplotlib import); the report omits figure links",
+    )
     args_parsed = parser.parse_args()
 
     artifacts = Path(args_parsed.artifacts).resolve()
     out_dir = Path(args_parsed.out).resolve()
     figures_dir = out_dir / "figures"
-    ensure_directory(figures_dir)
+    draw = not args_parsed.no_figures
+    if draw:
+        ensure_directory(figures_dir)
 
     global args
-    args = argparse.Namespace(figures=figures_dir)
+    args = argparse.Namespace(figures=figures_dir, emit_svg=args_parsed.emit_svg)
 
     env = load_json(out_dir / "env.json") or {}
     status = load_json(artifacts / "status.json") or {}
 
-    bench_results: List[BenchResult] = []
-    for bench_file in sorted(artifacts.glob("repro/**/*.json")):
-        rel = bench_file.relative_to(artifacts)
-        name = str(rel.with_suffix(""))
-        payload = load_json(bench_file)
-        bench_results.append(extract_bench(name, rel, payload))
+    bench_results = collect_bench_results(artifacts, scan_files(artifacts / "repro"))
 
-    bench_fig = build_bench_fig(bench_results)
-    runtime_fig = build_runtime_fig(bench_results)
+    bench_fig = build_bench_fig(bench_results) if draw else None
+    runtime_fig = build_runtime_fig(bench_results) if draw else None
     bench_table = build_bench_table(bench_results)
 
     summary_path = artifacts / "runs" / "landscape" / "full" / "summary" / "SummaryReport.json"
     distributions, landscape_metrics = summarize_landscape(summary_path)
 
-    cest_fig = build_cest_fig(distributions.get("c_est", {})) if distributions else None
-    gap_fig = build_hist_fig("gap_proxy", distributions.get("gap_proxy", {})) if distributions else None
-    xi_fig = build_hist_fig("xi", distributions.get("xi", {})) if distributions and "xi" in distributions else None
-    pass_fig = build_pass_rate_fig(landscape_metrics.get("pass_rate"))
+    cest_fig = build_cest_fig(distributions.get("c_est", {})) if draw and distributions else None
+    gap_fig = build_hist_fig("gap_proxy", distributions.get("gap_proxy", {})) if draw and distributions else None
+    xi_fig = build_hist_fig("xi", distributions.get("xi", {})) if draw and "xi" in distributions else None
+    pass_fig = build_pass_rate_fig(landscape_metrics.get("pass_rate")) if draw else None
 
     assertions_index = artifacts / "runs" / "landscape" / "full" / "assertions" / "index.json"
     assertion_summary, assertion_jobs = summarize_assertions(assertions_index)
-    assertion_fig = build_assertion_fig(assertion_summary)
+    assertion_fig = build_assertion_fig(assertion_summary) if draw else None
 
     optional_status = {
         "paper": summarize_optional(artifacts / "paper" / "build" / "main.pdf"),
@@ -598,108 +894,92 @@ def main() -> None:
         "site": summarize_optional(artifacts / "site" / "dist"),
     }
 
-    report_lines: List[str] = []
+    report = io.StringIO()
     commit = env.get("git", {}).get("head", "unknown")
     timestamp = env.get("timestamp_utc", "unknown")
-    report_lines.append(f"# ASM Heavy Run Report ({commit[:8]})")
-    report_lines.append("")
-    report_lines.append(f"_Generated at {timestamp}_")
-    report_lines.append("")
+    print(f"# ASM Heavy Run Report ({commit[:8]})", file=report)
+    print(file=report)
+    print(f"_Generated at {timestamp}_", file=report)
+    print(file=report)
 
     tests_ok = status.get("tests_passed")
     repl_ok = status.get("replication_passed")
-    report_lines.append("## Status")
+    print("## Status", file=report)
     status_items = [
         ("Tests", "✅" if tests_ok else "❌"),
         ("Replication", "✅" if repl_ok else "❌"),
     ]
     for label, emoji in status_items:
-        report_lines.append(f"- {emoji} {label}")
-    report_lines.append("")
-
-    report_lines.append("## Environment")
-    report_lines.append(build_env_table(env))
-    report_lines.append("")
-
-    report_lines.append("## Benchmarks")
-    report_lines.append(bench_table)
-    if bench_fig:
-        png_path, _ = bench_fig
-        report_lines.append("")
-        report_lines.append(f"![Benchmark throughput]({png_path.relative_to(out_dir)})")
-    if runtime_fig:
-        png_path, _ = runtime_fig
-        report_lines.append("")
-        report_lines.append(f"![Benchmark runtimes]({png_path.relative_to(out_dir)})")
-    report_lines.append("")
-
-    report_lines.append("## Landscape Summary")
+        print(f"- {emoji} {label}", file=report)
+    print(file=report)
+
+    print("## Environment", file=report)
+    print(build_env_table(env), file=report)
+    print(file=report)
+
+    print("## Benchmarks", file=report)
+    print(bench_table, file=report)
+    write_figure_links(report, out_dir, [("Benchmark throughput", bench_fig), ("Benchmark runtimes", runtime_fig)])
+    print(file=report)
+
+    print("## Landscape Summary", file=report)
     totals = landscape_metrics.get("totals", {}) if landscape_metrics else {}
     if totals:
         jobs = totals.get("jobs", 0)
         passing = totals.get("passing", 0)
-        report_lines.append(f"- Jobs analysed: **{jobs}**")
-        report_lines.append(f"- Passing anthropic filters: **{passing}**")
+        print(f"- Jobs analysed: **{jobs}**", file=report)
+        print(f"- Passing anthropic filters: **{passing}**", file=report)
     else:
-        report_lines.append("Landscape summary unavailable (summary report missing).")
+        print("Landscape summary unavailable (summary report missing).", file=report)
     quantiles = landscape_metrics.get("quantiles", {}) if landscape_metrics else {}
     for metric_name in sorted(quantiles.keys()):
         metric = quantiles.get(metric_name, {})
-        report_lines.append(
-            f"- {metric_name} quantiles (Q05/Q50/Q95): {fmt_float(metric.get('q05'))} / {fmt_float(metric.get('q50'))} / {fmt_float(metric.get('q95'))}"
+        print(
+            f"- {metric_name} quantiles (Q05/Q50/Q95): {fmt_float(metric.get('q05'))} / {fmt_float(metric.get('q50'))} / {fmt_float(metric.get('q95'))}",
+            file=report,
         )
-    if cest_fig:
-        png_path, _ = cest_fig
-        report_lines.append("")
-        report_lines.append(f"![c_est distribution]({png_path.relative_to(out_dir)})")
-    if gap_fig:
-        png_path, _ = gap_fig
-        report_lines.append("")
-        report_lines.append(f"![gap proxy distribution]({png_path.relative_to(out_dir)})")
-    if xi_fig:
-        png_path, _ = xi_fig
-        report_lines.append("")
-        report_lines.append(f"![xi distribution]({png_path.relative_to(out_dir)})")
-    if pass_fig:
-        png_path, _ = pass_fig
-        report_lines.append("")
-        report_lines.append(f"![Anthropic pass rate]({png_path.relative_to(out_dir)})")
-    report_lines.append("")
-
-    report_lines.append("## Assertions")
+    write_figure_links(
+        report,
+        out_dir,
+        [
+            ("c_est distribution", cest_fig),
+            ("gap proxy distribution", gap_fig),
+            ("xi distribution", xi_fig),
+            ("Anthropic pass rate", pass_fig),
+        ],
+    )
+    print(file=report)
+
+    print("## Assertions", file=report)
     if assertion_summary:
         if assertion_jobs:
-            report_lines.append(f"- Jobs evaluated: **{assertion_jobs}**")
+            print(f"- Jobs evaluated: **{assertion_jobs}**", file=report)
         for name in sorted(assertion_summary.keys()):
             data = assertion_summary[name]
-            total = data["pass"] + data["fail"]
-            rate = data["pass"] / total if total else 0.0
-            worst = max(data["metrics"]) if data.get("metrics") else None
-            threshold = data.get("threshold")
-            threshold_fmt = json.dumps(threshold) if threshold is not None else "n/a"
-            report_lines.append(
-                f"- **{name}**: pass rate {rate:.1%} (pass {data['pass']}, fail {data['fail']}), worst metric {fmt_float(worst)} vs {threshold_fmt}"
+            total = data.passed + data.failed
+            rate = data.passed / total if total else 0.0
+            worst = max(data.metrics) if data.metrics else None
+            threshold_fmt = json.dumps(data.threshold) if data.threshold is not None else "n/a"
+            print(
+                f"- **{name}**: pass rate {rate:.1%} (pass {data.passed}, fail {data.failed}), worst metric {fmt_float(worst)} vs {threshold_fmt}",
+                file=report,
             )
-        if assertion_fig:
-            png_path, _ = assertion_fig
-            report_lines.append("")
-            report_lines.append(f"![Assertion outcomes]({png_path.relative_to(out_dir)})")
+        write_figure_links(report, out_dir, [("Assertion outcomes", assertion_fig)])
     else:
-        report_lines.append("Assertions summary unavailable (index missing).")
-    report_lines.append("")
+        print("Assertions summary unavailable (index missing).", file=report)
+    print(file=report)
 
     ablation_rows = discover_ablation_rows(artifacts)
-    report_lines.append("## Ablations")
-    report_lines.append(build_ablation_table(ablation_rows))
-    report_lines.append("")
+    print("## Ablations", file=report)
+    print(build_ablation_table(ablation_rows), file=report)
+    print(file=report)
 
-    report_lines.append("## Optional Outputs")
+    print("## Optional Outputs", file=report)
     for key, message in optional_status.items():
-        report_lines.append(f"- {key.replace('_', ' ').title()}: {message}")
-    report_lines.append("")
+        print(f"- {key.replace('_', ' ').title()}: {message}", file=report)
 
     report_path = out_dir / "report.md"
-    report_path.write_text("\n".join(report_lines), encoding="utf8")
+    report_path.write_text(report.getvalue(), encoding="utf8")
 
 
 if __name__ == "__main__":
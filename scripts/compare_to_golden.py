@@ -7,7 +7,12 @@ import argparse
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
 
 DEFAULT_ABS_TOL = 1e-9
 DEFAULT_REL_TOL = 1e-3
@@ -34,11 +39,14 @@ class Tolerance:
 
     @classmethod
     def from_mapping(cls, mapping: Dict[str, Any]) -> "Tolerance":
+        # PyYAML resolves exponents without a dot (``1e-3``) to strings.
+        lower = mapping.get("min")
+        upper = mapping.get("max")
         return cls(
-            min=mapping.get("min"),
-            max=mapping.get("max"),
-            abs=mapping.get("abs", DEFAULT_ABS_TOL),
-            rel=mapping.get("rel", DEFAULT_REL_TOL),
+            min=float(lower) if lower is not None else None,
+            max=float(upper) if upper is not None else None,
+            abs=float(mapping.get("abs", DEFAULT_ABS_TOL)),
+            rel=float(mapping.get("rel", DEFAULT_REL_TOL)),
         )
 
 
@@ -47,7 +55,9 @@ def load_plan(path: Path) -> Dict[str, Any]:
     try:
         import yaml  # type: ignore
 
-        return dict(yaml.safe_load(text))  # pragma: no cover - exercised in CI
+        # Prefer the libyaml-backed loader when PyYAML was built against it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return dict(yaml.load(text, Loader=loader))  # pragma: no cover - exercised in CI
     except Exception:
         # Fallback: minimal YAML parser for indent-based mappings and lists.
         return simple_yaml(text)
@@ -104,7 +114,14 @@ def parse_scalar(value: str) -> Any:
 
 
 def load_report(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text())
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(data)
 
 
 def collect_tolerances(plan: Dict[str, Any]) -> Dict[str, Tolerance]:
@@ -118,18 +135,24 @@ def collect_tolerances(plan: Dict[str, Any]) -> Dict[str, Tolerance]:
     return tolerances
 
 
-def compare(report: Dict[str, Any], golden: Dict[str, Any], tolerances: Dict[str, Tolerance]) -> Tuple[bool, Dict[str, Any]]:
+def compare(
+    report: Dict[str, Any],
+    golden: Dict[str, Any],
+    tolerances: Dict[str, Tolerance],
+    collect_diff: bool = True,
+) -> Tuple[bool, Dict[str, Any]]:
+    """Check ``report`` against ``golden``; the summary is empty unless ``collect_diff``."""
     jobs_report = report.get("jobs", [])
     jobs_golden = golden.get("jobs", [])
     if len(jobs_report) != len(jobs_golden):
         return False, {"error": "job_count_mismatch", "report": len(jobs_report), "golden": len(jobs_golden)}
 
-    diff_summary = {"jobs": []}
+    entries: List[Dict[str, Any]] = []
     ok = True
     for idx, (job_report, job_golden) in enumerate(zip(jobs_report, jobs_golden)):
         kpis_report = job_report.get("metrics", {}).get("kpis", {})
         kpis_golden = job_golden.get("metrics", {}).get("kpis", {})
-        entry = {"job": idx, "metrics": {}}
+        metrics: Dict[str, Any] = {}
         for name, golden_payload in kpis_golden.items():
             golden_value = float(golden_payload.get("value"))
             report_value = float(kpis_report.get(name, {}).get("value"))
@@ -144,17 +167,18 @@ def compare(report: Dict[str, Any], golden: Dict[str, Any], tolerances: Dict[str
                 within_bounds = False
             status = within and within_bounds
             ok = ok and status
-            entry["metrics"][name] = {
-                "report": report_value,
-                "golden": golden_value,
-                "abs_delta": abs_delta,
-                "allowed": allowed,
-                "within_delta": within,
-                "within_bounds": within_bounds,
-                "pass": status,
-            }
-        diff_summary["jobs"].append(entry)
-    return ok, diff_summary
+            if collect_diff:
+                metrics[name] = {
+                    "report": report_value,
+                    "golden": golden_value,
+                    "abs_delta": abs_delta,
+                    "allowed": allowed,
+                    "within_delta": within,
+                    "within_bounds": within_bounds,
+                    "pass": status,
+                }
+        entries.append({"job": idx, "metrics": metrics})
+    return ok, {"jobs": entries} if collect_diff else {}
 
 
 def main() -> int:
@@ -163,7 +187,7 @@ def main() -> int:
     tolerances = collect_tolerances(plan)
     report = load_report(Path(args.report))
     golden = load_report(Path(args.golden))
-    ok, diff_summary = compare(report, golden, tolerances)
+    ok, diff_summary = compare(report, golden, tolerances, collect_diff=bool(args.diff))
     if args.diff:
         Path(args.diff).parent.mkdir(parents=True, exist_ok=True)
         Path(args.diff).write_text(json.dumps(diff_summary, indent=2) + "\n")
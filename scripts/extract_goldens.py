@@ -12,7 +12,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
-from compare_to_golden import load_plan  # reuse parser helpers
+from compare_to_golden import load_plan, load_report  # reuse parser helpers
 
 
 def parse_args() -> argparse.Namespace:
@@ -24,8 +24,9 @@ def parse_args() -> argparse.Namespace:
 
 
 def canonicalise_report(report_path: Path) -> str:
-    data = json.loads(report_path.read_text())
-    return json.dumps(data, indent=2, sort_keys=True) + "\n"
+    # Serialise with the stdlib so committed goldens keep their exact byte
+    # format (ASCII escapes, exponent spelling, NaN handling).
+    return json.dumps(load_report(report_path), indent=2, sort_keys=True) + "\n"
 
 
 def main() -> int:
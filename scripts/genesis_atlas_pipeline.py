@@ -6,26 +6,46 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import shutil
 import statistics
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the libyaml-backed loader when PyYAML was built against it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(data)
 
 
 def save_json(payload: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Stays on json: orjson writes NaN/Infinity as null and spells exponents
+    # differently (1e-7 vs 1e-07), which would change the committed outputs.
     with path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2, sort_keys=True)
 
 
 def parse_rule_map(plan_path: Path) -> Dict[int, str]:
-    data = yaml.safe_load(plan_path.read_text(encoding="utf-8"))
+    data = yaml.load(plan_path.read_text(encoding="utf-8"), Loader=YAML_LOADER)
     rule_entries = data.get("rules", []) or [{"id": 0, "label": "default"}]
     return {int(entry["id"]): str(entry["label"]) for entry in rule_entries}
 
@@ -63,17 +83,20 @@ def command_filter(args: argparse.Namespace) -> None:
     stage1_root = Path(args.stage1_root)
     report = load_json(report_path)
     rule_map = parse_rule_map(plan_path)
+    jobs = report.get("jobs", [])
+    min_gap = args.min_gap
+    max_energy = args.max_energy
     candidates: List[Dict[str, Any]] = []
-    for job in report.get("jobs", []):
-        record = build_candidate_record(job, rule_map, stage1_root)
-        gap = record.get("gap_proxy") or 0.0
-        energy = record.get("energy_final") or 0.0
-        if gap < args.min_gap:
+    for job in jobs:
+        # Apply the KPI cuts first so rejected jobs never allocate a record.
+        kpis = job.get("kpis", {})
+        if (kpis.get("gap_proxy") or 0.0) < min_gap:
             continue
-        if energy > args.max_energy:
+        if (kpis.get("energy_final") or 0.0) > max_energy:
             continue
-        candidates.append(record)
-    candidates.sort(key=lambda item: item.get("gap_proxy", 0.0), reverse=True)
+        candidates.append(build_candidate_record(job, rule_map, stage1_root))
+    # build_candidate_record always sets gap_proxy, so the lambda's default was never used.
+    candidates.sort(key=itemgetter("gap_proxy"), reverse=True)
     summary = {
         "criteria": {
             "min_gap": args.min_gap,
@@ -82,7 +105,7 @@ def command_filter(args: argparse.Namespace) -> None:
         "plan": str(plan_path),
         "report": str(report_path),
         "stage1_root": str(stage1_root),
-        "total_jobs": len(report.get("jobs", [])),
+        "total_jobs": len(jobs),
         "fertile_count": len(candidates),
         "candidates": candidates,
     }
@@ -91,7 +114,55 @@ def command_filter(args: argparse.Namespace) -> None:
 
 def copy_file(src: Path, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+    shutil.copyfile(src, dest)
+
+
+def map_candidates(
+    func: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    records: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Apply ``func`` to each candidate on a thread pool, keeping order and dropping ``None``."""
+    if len(records) < 2:
+        results = [func(record) for record in records]
+    else:
+        # Per-candidate work is file I/O, so threads overlap it despite the GIL.
+        with ThreadPoolExecutor(max_workers=min(32, len(records))) as executor:
+            results = list(executor.map(func, records))
+    return [result for result in results if result is not None]
+
+
+def stage2_candidate(out_dir: Path, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    job_dir = Path(record["job_dir"])
+    spec_path = job_dir / "spectrum" / "spectrum_report.json"
+    gauge_path = job_dir / "gauge" / "gauge_report.json"
+    if not spec_path.exists() or not gauge_path.exists():
+        return None
+    spectrum = load_json(spec_path)
+    gauge = load_json(gauge_path)
+    dest_dir = out_dir / record["job_id"]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    copy_file(spec_path, dest_dir / "spectrum_report.json")
+    copy_file(gauge_path, dest_dir / "gauge_report.json")
+    summary = {
+        "job_id": record["job_id"],
+        "seed": record["seed"],
+        "rule_id": record["rule_id"],
+        "rule_label": record["rule_label"],
+        "gap_proxy": record.get("gap_proxy"),
+        "xi": record.get("xi"),
+        "mass_gap": spectrum.get("spectral_gap"),
+        "symmetry_rank": len(gauge.get("factors", [])),
+        "factors": gauge.get("factors", []),
+        "closure_pass": gauge.get("closure_pass"),
+        "ward_pass": gauge.get("ward_pass"),
+    }
+    standard_model = {
+        "metadata": summary,
+        "spectrum": spectrum,
+        "gauge": gauge,
+    }
+    save_json(standard_model, dest_dir / "standard_model.json")
+    return summary
 
 
 def command_stage2(args: argparse.Namespace) -> None:
@@ -100,40 +171,36 @@ def command_stage2(args: argparse.Namespace) -> None:
     candidates = data.get("candidates", [])
     limit = args.limit or len(candidates)
     selected = candidates[:limit]
-    summaries: List[Dict[str, Any]] = []
-    for record in selected:
-        job_dir = Path(record["job_dir"])
-        spec_path = job_dir / "spectrum" / "spectrum_report.json"
-        gauge_path = job_dir / "gauge" / "gauge_report.json"
-        if not spec_path.exists() or not gauge_path.exists():
-            continue
-        spectrum = load_json(spec_path)
-        gauge = load_json(gauge_path)
-        dest_dir = Path(args.out) / record["job_id"]
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        copy_file(spec_path, dest_dir / "spectrum_report.json")
-        copy_file(gauge_path, dest_dir / "gauge_report.json")
-        summary = {
-            "job_id": record["job_id"],
-            "seed": record["seed"],
-            "rule_id": record["rule_id"],
-            "rule_label": record["rule_label"],
-            "gap_proxy": record.get("gap_proxy"),
-            "xi": record.get("xi"),
-            "mass_gap": spectrum.get("spectral_gap"),
-            "symmetry_rank": len(gauge.get("factors", [])),
-            "factors": gauge.get("factors", []),
-            "closure_pass": gauge.get("closure_pass"),
-            "ward_pass": gauge.get("ward_pass"),
-        }
-        standard_model = {
-            "metadata": summary,
-            "spectrum": spectrum,
-            "gauge": gauge,
-        }
-        save_json(standard_model, dest_dir / "standard_model.json")
-        summaries.append(summary)
-    save_json({"standard_models": summaries}, Path(args.out) / "standard_models_summary.json")
+    out_root = Path(args.out)
+    summaries = map_candidates(partial(stage2_candidate, out_root), selected)
+    save_json({"standard_models": summaries}, out_root / "standard_models_summary.json")
+
+
+def stage3_candidate(out_dir: Path, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    job_dir = Path(record["job_dir"])
+    interact_path = job_dir / "interact" / "interaction_report.json"
+    if not interact_path.exists():
+        return None
+    report = load_json(interact_path)
+    dest_dir = out_dir / record["job_id"]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    copy_file(interact_path, dest_dir / "interaction_report.json")
+    g_values = report.get("g", record.get("g", []))
+    mean_g = statistics.fmean(g_values) if g_values else 0.0
+    field_theory = {
+        "job_id": record["job_id"],
+        "seed": record["seed"],
+        "rule_id": record["rule_id"],
+        "rule_label": record["rule_label"],
+        "xi": record.get("xi"),
+        "gap_proxy": record.get("gap_proxy"),
+        "c_est": report.get("c_est", record.get("c_est")),
+        "lambda_h": report.get("lambda_h", record.get("lambda_h")),
+        "g": g_values,
+        "mean_g": round(mean_g, 6),
+    }
+    save_json(field_theory, dest_dir / "field_theory_report.json")
+    return field_theory
 
 
 def command_stage3(args: argparse.Namespace) -> None:
@@ -141,38 +208,37 @@ def command_stage3(args: argparse.Namespace) -> None:
     candidates = data.get("candidates", [])
     limit = args.limit or len(candidates)
     selected = candidates[:limit]
-    summaries: List[Dict[str, Any]] = []
-    for record in selected:
-        job_dir = Path(record["job_dir"])
-        interact_path = job_dir / "interact" / "interaction_report.json"
-        if not interact_path.exists():
-            continue
-        report = load_json(interact_path)
-        dest_dir = Path(args.out) / record["job_id"]
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        copy_file(interact_path, dest_dir / "interaction_report.json")
-        g_values = report.get("g", record.get("g", []))
-        mean_g = statistics.fmean(g_values) if g_values else 0.0
-        field_theory = {
-            "job_id": record["job_id"],
-            "seed": record["seed"],
-            "rule_id": record["rule_id"],
-            "rule_label": record["rule_label"],
-            "xi": record.get("xi"),
-            "gap_proxy": record.get("gap_proxy"),
-            "c_est": report.get("c_est", record.get("c_est")),
-            "lambda_h": report.get("lambda_h", record.get("lambda_h")),
-            "g": g_values,
-            "mean_g": round(mean_g, 6),
-        }
-        save_json(field_theory, dest_dir / "field_theory_report.json")
-        summaries.append(field_theory)
-    save_json({"field_theories": summaries}, Path(args.out) / "field_theory_summary.json")
+    out_root = Path(args.out)
+    summaries = map_candidates(partial(stage3_candidate, out_root), selected)
+    save_json({"field_theories": summaries}, out_root / "field_theory_summary.json")
+
+
+def running_slopes(bucket: List[Dict[str, Any]]) -> List[float]:
+    """Average dg/dlog(xi) per coupling over consecutive entries of an xi-sorted bucket.
+
+    Each pair only contributes the couplings both entries report.
+    """
+    slopes: List[List[float]] = []
+    for prev, curr in zip(bucket, bucket[1:]):
+        prev_xi = max(prev.get("xi", 1.0), 1e-6)
+        curr_xi = max(curr.get("xi", prev_xi + 1e-6), 1e-6)
+        log_ratio = math.log(curr_xi / prev_xi)
+        log_ratio = log_ratio if abs(log_ratio) > 1e-6 else 1e-6
+        prev_g = prev.get("g", [])
+        curr_g = curr.get("g", [])
+        slopes.append(
+            [round((curr_g[idx] - prev_g[idx]) / log_ratio, 6) for idx in range(min(len(prev_g), len(curr_g)))]
+        )
+    return [
+        round(statistics.fmean([s[idx] for s in slopes if idx < len(s)]), 6)
+        for idx in range(max(len(s) for s in slopes))
+    ]
 
 
 def command_stage4(args: argparse.Namespace) -> None:
     summary = load_json(Path(args.field_summary))
     entries = summary.get("field_theories", [])
+    out_root = Path(args.out)
     groups: Dict[int, List[Dict[str, Any]]] = {}
     for entry in entries:
         groups.setdefault(entry["rule_id"], []).append(entry)
@@ -181,24 +247,7 @@ def command_stage4(args: argparse.Namespace) -> None:
         if len(bucket) < 2:
             continue
         bucket.sort(key=lambda item: item.get("xi", 0.0))
-        slopes: List[List[float]] = []
-        for prev, curr in zip(bucket, bucket[1:]):
-            prev_xi = max(prev.get("xi", 1.0), 1e-6)
-            curr_xi = max(curr.get("xi", prev_xi + 1e-6), 1e-6)
-            log_ratio = math.log(curr_xi / prev_xi)
-            log_ratio = log_ratio if abs(log_ratio) > 1e-6 else 1e-6
-            prev_g = prev.get("g", [])
-            curr_g = curr.get("g", [])
-            delta = []
-            for idx in range(min(len(prev_g), len(curr_g))):
-                delta.append(round((curr_g[idx] - prev_g[idx]) / log_ratio, 6))
-            slopes.append(delta)
-        if not slopes:
-            continue
-        avg_slopes = [
-            round(statistics.fmean([s[idx] for s in slopes if idx < len(s)]), 6)
-            for idx in range(max(len(s) for s in slopes))
-        ]
+        avg_slopes = running_slopes(bucket)
         avg_lambda = round(statistics.fmean(entry.get("lambda_h", 0.0) for entry in bucket), 6)
         report = {
             "rule_id": rule_id,
@@ -208,12 +257,12 @@ def command_stage4(args: argparse.Namespace) -> None:
             "dg_dlog_xi": avg_slopes,
         }
         reports.append(report)
-        save_json(report, Path(args.out) / f"running_{rule_id}.json")
+        save_json(report, out_root / f"running_{rule_id}.json")
     aggregate = {
         "reports": reports,
         "total_rules": len(reports),
     }
-    save_json(aggregate, Path(args.out) / "running_summary.json")
+    save_json(aggregate, out_root / "running_summary.json")
 
 
 def main() -> None:
@@ -10,9 +10,15 @@ from __future__ import annotations
 
 import argparse
 import csv
+import fnmatch
 import json
+import os
 import pathlib
-from typing import Dict, Iterable, List, Sequence, Tuple
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
 try:
     import matplotlib
@@ -30,16 +36,49 @@ except ModuleNotFoundError:
     plt = None  # type: ignore[assignment]
     HAS_MATPLOTLIB = False
 
+# Drop the timestamp and version strings so PDFs are byte-identical across runs
+# and Matplotlib releases without relying on SOURCE_DATE_EPOCH.
+PDF_METADATA = {"CreationDate": None, "Creator": None, "Producer": None}
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+# Below this many sources, forking workers costs more than rendering in-process.
+FIGURE_POOL_MIN_SOURCES = 4
+
+# Dispersion series longer than this are drawn as rasterised dots.
+DENSE_SCATTER_POINTS = 200
+
+_SUBPLOT_SIDES = ("left", "bottom", "right", "top")
+
+
 def _ensure_dir(path: pathlib.Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _load_json(path: pathlib.Path) -> Any:
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(data)
+
+
 def _escape_pdf_text(value: str) -> str:
     return value.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
 
 
 def _write_placeholder_pdf(path: pathlib.Path, title: str, body: Sequence[str]) -> None:
-    header = "%PDF-1.4\n"
     lines = [
         "BT",
         "/F1 18 Tf",
@@ -56,86 +95,164 @@ def _write_placeholder_pdf(path: pathlib.Path, title: str, body: Sequence[str])
         lines.append("(No data available) Tj")
         lines.append("T*")
     lines.append("ET")
-    stream = "\n".join(lines) + "\n"
-    stream_bytes = stream.encode("utf-8")
-    objects = [
-        "1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n",
-        "2 0 obj<< /Type /Pages /Kids [3 0 R] /Count 1 >>endobj\n",
-        "3 0 obj<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>endobj\n",
-        f"4 0 obj<< /Length {len(stream_bytes)} >>stream\n{stream}endstream\nendobj\n",
-        "5 0 obj<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>endobj\n",
-    ]
-    offsets = []
-    cursor = len(header)
-    for obj in objects:
-        offsets.append(cursor)
-        cursor += len(obj.encode("utf-8"))
-    xref = ["xref\n", "0 6\n", "0000000000 65535 f \n"]
-    for offset in offsets:
-        xref.append(f"{offset:010d} 00000 n \n")
-    trailer = [
-        "trailer<< /Size 6 /Root 1 0 R >>\n",
-        "startxref\n",
-        f"{cursor}\n",
-        "%%EOF\n",
+    stream = ("\n".join(lines) + "\n").encode("utf-8")
+    parts = [
+        b"%PDF-1.4\n",
+        b"1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n",
+        b"2 0 obj<< /Type /Pages /Kids [3 0 R] /Count 1 >>endobj\n",
+        b"3 0 obj<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>endobj\n",
+        b"4 0 obj<< /Length %d >>stream\n%sendstream\nendobj\n" % (len(stream), stream),
+        b"5 0 obj<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>endobj\n",
     ]
-    pdf_bytes = header.encode("utf-8") + b"".join(obj.encode("utf-8") for obj in objects) + b"".join(
-        part.encode("utf-8") for part in xref + trailer
-    )
+    # Running end offsets: objects 1-5 start where the previous part ends, and
+    # the xref table starts after the last object.
+    ends = list(accumulate(map(len, parts)))
+    parts.append(b"xref\n0 6\n0000000000 65535 f \n")
+    parts.extend(b"%010d 00000 n \n" % offset for offset in ends[:-1])
+    parts.append(b"trailer<< /Size 6 /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % ends[-1])
+    pdf_bytes = b"".join(parts)
     path.write_bytes(pdf_bytes)
 
 
+@lru_cache(maxsize=None)
+def _scan_dir(directory: pathlib.Path) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the sorted file and subdirectory names directly inside ``directory``.
+
+    One ``os.scandir`` serves every pattern looked up in the same directory;
+    ``build_figures`` clears the cache so each run sees fresh listings.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+    except OSError:
+        pass
+    return tuple(sorted(files)), tuple(sorted(dirs))
+
+
+def _glob_files(directory: pathlib.Path, pattern: str) -> List[pathlib.Path]:
+    files, _ = _scan_dir(directory)
+    return [directory / name for name in fnmatch.filter(files, pattern)]
+
+
 def _discover_energy_csv(root: pathlib.Path, fixtures: pathlib.Path) -> List[pathlib.Path]:
-    candidates = sorted(root.glob("energy_vs_sweep_*.csv"))
+    candidates = _glob_files(root, "energy_vs_sweep_*.csv")
     if candidates:
         return candidates
-    return sorted(fixtures.glob("energy_vs_sweep_*.csv"))
+    return _glob_files(fixtures, "energy_vs_sweep_*.csv")
 
 
 def _discover_dispersion_csv(root: pathlib.Path, fixtures: pathlib.Path) -> List[pathlib.Path]:
-    candidates = sorted(root.glob("dispersion_*.csv"))
+    candidates = _glob_files(root, "dispersion_*.csv")
     if candidates:
         return candidates
-    fallback = fixtures / "dispersion_seed0.csv"
-    return [fallback] if fallback.exists() else []
+    return _glob_files(fixtures, "dispersion_seed0.csv")
+
+
+def _resolve_series_columns(fields: Sequence[str]) -> Tuple[str, str]:
+    if {"sweep", "energy"}.issubset(fields):
+        return "sweep", "energy"
+    if {"k", "energy"}.issubset(fields):
+        return "k", "energy"
+    if {"index", "value"}.issubset(fields):
+        return "index", "value"
+    key_x, key_y = fields[:2]
+    return key_x, key_y
 
 
 def _load_csv_series(path: pathlib.Path) -> Tuple[List[float], List[float]]:
-    xs: List[float] = []
-    ys: List[float] = []
-    with path.open() as handle:
-        reader = csv.DictReader(handle)
-        fields = reader.fieldnames or []
-        if {"sweep", "energy"}.issubset(fields):
-            key_x, key_y = "sweep", "energy"
-        elif {"k", "energy"}.issubset(fields):
-            key_x, key_y = "k", "energy"
-        elif {"index", "value"}.issubset(fields):
-            key_x, key_y = "index", "value"
-        else:
-            key_x, key_y = fields[:2]  # type: ignore[index]
+    with path.open(newline="") as handle:
+        reader = csv.reader(handle)
+        fields = next(reader, [])
+        key_x, key_y = _resolve_series_columns(fields)
+        ix, iy = fields.index(key_x), fields.index(key_y)
+        if np is not None:
+            try:
+                with warnings.catch_warnings():
+                    # Header-only files are valid here and simply yield no points.
+                    warnings.simplefilter("ignore", UserWarning)
+                    # comments=None: a "#" row is malformed data, as it is for csv.reader.
+                    data = np.loadtxt(
+                        handle, delimiter=",", usecols=(ix, iy), ndmin=2, dtype=np.float64, comments=None
+                    )
+            except ValueError:
+                # Quoted cells or ragged rows; let the csv module handle them below.
+                handle.seek(0)
+                reader = csv.reader(handle)
+                next(reader, None)
+            else:
+                return data[:, 0].tolist(), data[:, 1].tolist()
+        xs: List[float] = []
+        ys: List[float] = []
         for row in reader:
-            xs.append(float(row[key_x]))
-            ys.append(float(row[key_y]))
+            if not row:
+                # Blank lines, which DictReader used to skip.
+                continue
+            xs.append(float(row[ix]))
+            ys.append(float(row[iy]))
     return xs, ys
 
 
-def _plot_energy(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) -> None:
-    generated = False
+def _reset_axes(fig: Any, ax: Any) -> None:
+    """Return a reused figure to the state ``plt.subplots`` would create.
+
+    ``tight_layout`` starts from the current subplot parameters, so without the
+    reset each plot's margins would depend on the source drawn before it.
+    """
+    ax.clear()
+    fig.subplots_adjust(**{side: plt.rcParams[f"figure.subplot.{side}"] for side in _SUBPLOT_SIDES})
+
+
+def _render_in_batches(
+    render: Callable[[pathlib.Path, List[pathlib.Path]], None],
+    figures_dir: pathlib.Path,
+    sources: List[pathlib.Path],
+) -> None:
+    """Call ``render(figures_dir, batch)`` over ``sources``, one batch per worker process.
+
+    Each figure is written to its own file, so batches are independent; every
+    worker reuses a single Figure across its batch.
+    """
+    workers = min(len(sources), os.cpu_count() or 1)
+    if HAS_MATPLOTLIB and len(sources) >= FIGURE_POOL_MIN_SOURCES and workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            # Sandboxed hosts may refuse the semaphores a process pool needs.
+            executor = None
+        if executor is not None:
+            # Errors raised while rendering propagate instead of triggering a serial rerun.
+            batches = [sources[offset::workers] for offset in range(workers)]
+            with executor:
+                list(executor.map(partial(render, figures_dir), batches))
+            return
+    render(figures_dir, sources)
+
+
+def _render_energy(figures_dir: pathlib.Path, sources: List[pathlib.Path]) -> None:
+    fig = ax = None
     for source in sources:
         xs, ys = _load_csv_series(source)
         seed = source.stem.split("_")[-1]
         out_path = figures_dir / f"energy_vs_sweep_{seed}.pdf"
         if HAS_MATPLOTLIB:
-            fig, ax = plt.subplots(figsize=(4.8, 3.2))
+            # One figure serves every seed; only the axes are reset between plots.
+            if fig is None:
+                fig, ax = plt.subplots(figsize=(4.8, 3.2))
+            else:
+                _reset_axes(fig, ax)
             ax.plot(xs, ys, marker="o", color="#1b9e77", linewidth=1.5)
             ax.set_xlabel("Sweep")
             ax.set_ylabel("Energy")
             ax.set_title(f"Energy vs sweep ({seed})")
             ax.grid(True, alpha=0.3)
             fig.tight_layout()
-            fig.savefig(out_path)
-            plt.close(fig)
+            fig.savefig(out_path, metadata=PDF_METADATA)
         else:
             body = [
                 "Matplotlib not available; rendered fallback figure.",
@@ -143,34 +260,48 @@ def _plot_energy(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) ->
                 f"Points: {len(xs)}",
             ]
             _write_placeholder_pdf(out_path, f"Energy vs sweep ({seed})", body)
-        generated = True
-    if not generated:
-        _write_placeholder_pdf(
-            figures_dir / "energy_vs_sweep_placeholder.pdf",
-            "Energy vs sweep",
-            ["No energy data discovered."],
-        )
+    if fig is not None:
+        plt.close(fig)
 
 
-def _plot_dispersion(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) -> None:
-    generated = False
+def _plot_energy(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) -> None:
+    sources = list(sources)
+    if sources:
+        _render_in_batches(_render_energy, figures_dir, sources)
+        return
+    _write_placeholder_pdf(
+        figures_dir / "energy_vs_sweep_placeholder.pdf",
+        "Energy vs sweep",
+        ["No energy data discovered."],
+    )
+
+
+def _render_dispersion(figures_dir: pathlib.Path, sources: List[pathlib.Path]) -> None:
+    fig = ax = None
     for source in sources:
         xs, ys = _load_csv_series(source)
         out_path = figures_dir / f"{source.stem}.pdf"
         title = source.stem.replace("_", " ")
         if HAS_MATPLOTLIB:
-            fig, ax = plt.subplots(figsize=(4.2, 3.2))
-            ax.scatter(xs, ys, color="#d95f02")
+            if fig is None:
+                fig, ax = plt.subplots(figsize=(4.2, 3.2))
+            else:
+                _reset_axes(fig, ax)
+            if len(xs) > DENSE_SCATTER_POINTS:
+                # Embed dense point clouds as an image rather than one vector marker per point.
+                ax.plot(xs, ys, linestyle="", marker=".", markersize=2, color="#d95f02", rasterized=True)
+            else:
+                ax.scatter(xs, ys, color="#d95f02")
             coeffs = _fit_parabola(xs, ys)
-            dense_x = _linspace(min(xs), max(xs), 100)
-            ax.plot(dense_x, [_eval_parabola(coeffs, x) for x in dense_x], color="#7570b3")
+            # Matplotlib depends on NumPy, so the fit curve is evaluated as arrays.
+            dense_x = np.linspace(min(xs), max(xs), 100)
+            ax.plot(dense_x, np.polyval(coeffs, dense_x), color="#7570b3")
             ax.set_xlabel("k")
             ax.set_ylabel("Energy")
             ax.set_title(title)
             ax.grid(True, alpha=0.3)
             fig.tight_layout()
-            fig.savefig(out_path)
-            plt.close(fig)
+            fig.savefig(out_path, metadata=PDF_METADATA)
         else:
             coeffs = _fit_parabola(xs, ys)
             body = [
@@ -179,18 +310,29 @@ def _plot_dispersion(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path])
                 f"Fitted parabola: a={coeffs[0]:.3g}, b={coeffs[1]:.3g}, c={coeffs[2]:.3g}",
             ]
             _write_placeholder_pdf(out_path, title, body)
-        generated = True
-    if not generated:
-        _write_placeholder_pdf(
-            figures_dir / "dispersion_placeholder.pdf",
-            "Dispersion",
-            ["No dispersion data discovered."],
-        )
+    if fig is not None:
+        plt.close(fig)
+
+
+def _plot_dispersion(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) -> None:
+    sources = list(sources)
+    if sources:
+        _render_in_batches(_render_dispersion, figures_dir, sources)
+        return
+    _write_placeholder_pdf(
+        figures_dir / "dispersion_placeholder.pdf",
+        "Dispersion",
+        ["No dispersion data discovered."],
+    )
 
 
 def _fit_parabola(xs: List[float], ys: List[float]) -> Tuple[float, float, float]:
     if len(xs) < 3:
         return (0.0, 0.0, sum(ys) / len(ys))
+    if np is not None:
+        # Least squares via LAPACK; better conditioned than the normal equations below.
+        a, b, c = np.polyfit(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), 2).tolist()
+        return (a, b, c)
     s_x2 = sum(x * x for x in xs)
     s_x3 = sum(x ** 3 for x in xs)
     s_x4 = sum(x ** 4 for x in xs)
@@ -200,6 +342,19 @@ def _fit_parabola(xs: List[float], ys: List[float]) -> Tuple[float, float, float
     s_y = sum(ys)
     n = float(len(xs))
 
+    # Cramer's rule on the symmetric normal equations. Hadamard's inequality
+    # bounds det by the diagonal product, so a relatively tiny det means the
+    # system is near-singular and the pivoting solver handles it instead.
+    minor_0 = s_x2 * n - s_x * s_x
+    minor_1 = s_x3 * n - s_x * s_x2
+    minor_2 = s_x3 * s_x - s_x2 * s_x2
+    det = s_x4 * minor_0 - s_x3 * minor_1 + s_x2 * minor_2
+    if abs(det) > 1e-12 * s_x4 * s_x2 * n:
+        a = (s_x2y * minor_0 - s_x3 * (s_xy * n - s_x * s_y) + s_x2 * (s_xy * s_x - s_x2 * s_y)) / det
+        b = (s_x4 * (s_xy * n - s_x * s_y) - s_x2y * minor_1 + s_x2 * (s_x3 * s_y - s_x2 * s_xy)) / det
+        c = (s_x4 * (s_x2 * s_y - s_x * s_xy) - s_x3 * (s_x3 * s_y - s_x2 * s_xy) + s_x2y * minor_2) / det
+        return (a, b, c)
+
     matrix = [
         [s_x4, s_x3, s_x2],
         [s_x3, s_x2, s_x],
@@ -228,18 +383,6 @@ def _solve_linear_system(matrix: List[List[float]], rhs: List[float]) -> List[fl
     return [row[-1] for row in mat]
 
 
-def _linspace(start: float, stop: float, count: int) -> List[float]:
-    if count <= 1:
-        return [start]
-    step = (stop - start) / (count - 1)
-    return [start + step * i for i in range(count)]
-
-
-def _eval_parabola(coeffs: Tuple[float, float, float], x: float) -> float:
-    a, b, c = coeffs
-    return a * x * x + b * x + c
-
-
 def _plot_covariance(figures_dir: pathlib.Path, source: pathlib.Path | None) -> None:
     target = figures_dir / "rg_cov.pdf"
     if source is None or not source.exists():
@@ -254,7 +397,7 @@ def _plot_covariance(figures_dir: pathlib.Path, source: pathlib.Path | None) ->
         ax.set_title("RG covariance summary")
         ax.grid(True, alpha=0.3)
         fig.tight_layout()
-        fig.savefig(target)
+        fig.savefig(target, metadata=PDF_METADATA)
         plt.close(fig)
     else:
         body = [
@@ -268,8 +411,7 @@ def _plot_covariance(figures_dir: pathlib.Path, source: pathlib.Path | None) ->
 def _plot_ablations(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path]) -> None:
     items = []
     for source in sources:
-        with source.open() as handle:
-            data = json.load(handle)
+        data = _load_json(source)
         plan = data.get("plan_name", source.stem)
         kpis: Dict[str, List[float]] = data.get("kpis", {})
         for name, values in kpis.items():
@@ -286,17 +428,18 @@ def _plot_ablations(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path])
     items.sort(key=lambda item: (item[0], item[1]))
     if HAS_MATPLOTLIB:
         fig, ax = plt.subplots(figsize=(5.6, 3.4))
-        positions = range(len(items))
-        means = [item[2] for item in items]
-        errors = [[item[2] - item[3] for item in items], [item[4] - item[2] for item in items]]
+        # Matplotlib depends on NumPy, so np is always available on this branch.
+        positions = np.arange(len(items))
+        means, lows, highs = np.array([item[2:] for item in items], dtype=np.float64).T
+        errors = np.stack([means - lows, highs - means])
         ax.errorbar(positions, means, yerr=errors, fmt="o", color="#e7298a", capsize=4)
-        ax.set_xticks(list(positions))
+        ax.set_xticks(positions)
         ax.set_xticklabels([f"{plan}\n{name}" for plan, name, *_ in items], rotation=45, ha="right")
         ax.set_ylabel("KPI value")
         ax.set_title("Ablation KPI summary")
         ax.grid(True, axis="y", alpha=0.3)
         fig.tight_layout()
-        fig.savefig(target)
+        fig.savefig(target, metadata=PDF_METADATA)
         plt.close(fig)
     else:
         body = [
@@ -308,26 +451,27 @@ def _plot_ablations(figures_dir: pathlib.Path, sources: Iterable[pathlib.Path])
 
 def build_figures(replication: pathlib.Path, fixtures: pathlib.Path, figures: pathlib.Path) -> None:
     _ensure_dir(figures)
+    _scan_dir.cache_clear()
     energy_sources = _discover_energy_csv(replication, fixtures)
     if not energy_sources and replication.exists():
-        metrics = sorted(replication.glob("run_*/metrics.csv"))
-        energy_sources = metrics
+        _, run_dirs = _scan_dir(replication)
+        metrics = [replication / name / "metrics.csv" for name in fnmatch.filter(run_dirs, "run_*")]
+        energy_sources = [path for path in metrics if path.is_file()]
     _plot_energy(figures, energy_sources)
 
     dispersion_sources = _discover_dispersion_csv(replication, fixtures)
     _plot_dispersion(figures, dispersion_sources)
 
-    cov_source = None
-    if (replication / "covariance_summary.csv").exists():
-        cov_source = replication / "covariance_summary.csv"
-    elif (fixtures / "covariance_summary.csv").exists():
-        cov_source = fixtures / "covariance_summary.csv"
-    _plot_covariance(figures, cov_source)
+    # Served from the same cached listings as the CSV discovery above.
+    cov_sources = _glob_files(replication, "covariance_summary.csv") or _glob_files(
+        fixtures, "covariance_summary.csv"
+    )
+    _plot_covariance(figures, cov_sources[0] if cov_sources else None)
 
     ablation_root = replication / "ablations"
     if not ablation_root.exists():
         ablation_root = fixtures / "ablations"
-    ablation_sources = sorted(ablation_root.glob("*.json"))
+    ablation_sources = _glob_files(ablation_root, "*.json")
     _plot_ablations(figures, ablation_sources)
 
 
@@ -4,17 +4,31 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
 
 def load_summary(run_dir: Path) -> Dict[str, Any] | None:
     summary_path = run_dir / "summary.json"
-    if not summary_path.exists():
+    try:
+        data = summary_path.read_bytes()
+    except FileNotFoundError:
         return None
     try:
-        return json.loads(summary_path.read_text())
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity literals the stdlib accepts.
+                pass
+        return json.loads(data)
     except json.JSONDecodeError:
         return None
 
@@ -35,10 +49,11 @@ def build_index(runs_dir: Path) -> Dict[str, Dict[str, Any]]:
     index: Dict[str, Dict[str, Any]] = {}
     if not runs_dir.exists():
         return index
-    for entry in sorted(runs_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        summary = load_summary(entry)
+    # DirEntry.is_dir() reuses the type readdir reported instead of a stat per entry.
+    with os.scandir(runs_dir) as entries:
+        run_dirs = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+    for entry in run_dirs:
+        summary = load_summary(Path(entry.path))
         if summary is None:
             index[entry.name] = {"status": "MISSING", "metric": None}
             continue
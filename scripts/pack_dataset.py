@@ -6,16 +6,38 @@ import hashlib
 import json
 import pathlib
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+# Formats that are already compressed; deflating them again costs CPU for no size win.
+STORED_SUFFIXES = frozenset({".gz", ".pdf", ".png", ".zip"})
 
 
 def compute_sha256(path: pathlib.Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C.
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
 
+def encode_manifest(manifest: dict) -> bytes:
+    if orjson is not None:
+        encoded = orjson.dumps(manifest)
+        # orjson writes non-ASCII as raw UTF-8 where json.dumps escapes it; only
+        # ASCII output is guaranteed to match the historical manifest bytes.
+        if encoded.isascii():
+            return encoded
+    return json.dumps(manifest, separators=(",", ":")).encode()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("root", type=pathlib.Path, help="root directory to bundle")
@@ -24,15 +46,18 @@ def main() -> None:
     parser.add_argument("--toolchain", default="asm", help="toolchain string")
     args = parser.parse_args()
 
+    paths = [path for path in sorted(args.root.rglob("*")) if path.is_file()]
+    # hashlib releases the GIL while digesting, so threads hash files concurrently;
+    # map() keeps the sorted order the manifest depends on.
+    with ThreadPoolExecutor() as executor:
+        digests = list(executor.map(compute_sha256, paths))
     artifacts = []
-    for path in sorted(args.root.rglob("*")):
-        if not path.is_file():
-            continue
+    for path, digest in zip(paths, digests):
         relative = path.relative_to(args.root).as_posix()
         artifacts.append({
             "kind": path.suffix.lstrip("."),
             "path": relative,
-            "sha256": compute_sha256(path),
+            "sha256": digest,
         })
 
     manifest = {
@@ -44,9 +69,11 @@ def main() -> None:
 
     args.out.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(args.out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr("manifest.json", json.dumps(manifest, separators=(",", ":")))
+        archive.writestr("manifest.json", encode_manifest(manifest))
         for artifact in artifacts:
-            archive.write(args.root / artifact["path"], artifact["path"])
+            source = args.root / artifact["path"]
+            compression = zipfile.ZIP_STORED if source.suffix in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+            archive.write(source, artifact["path"], compress_type=compression)
 
     print(f"bundle written to {args.out}")
 
@@ -8,23 +8,40 @@ import json
 import pathlib
 import sqlite3
 from collections import defaultdict
-from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _parse_json(text: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(text)
 
 
 def _load_json(*paths: pathlib.Path) -> Dict:
     for path in paths:
         if path and path.exists():
-            with path.open() as handle:
-                return json.load(handle)
+            return _parse_json(path.read_bytes())
     return {}
 
 
 def _render_table(headers: Iterable[str], rows: Iterable[Iterable[str]]) -> str:
     header_list = list(headers)
-    header_line = "| " + " | ".join(header_list) + " |"
-    divider = "| " + " | ".join(["---"] * len(header_list)) + " |"
-    body = "\n".join("| " + " | ".join(row) + " |" for row in rows)
-    return "\n".join([header_line, divider, body]) if body else "\n".join([header_line, divider])
+    lines = [
+        "| " + " | ".join(header_list) + " |",
+        "| " + " | ".join(["---"] * len(header_list)) + " |",
+    ]
+    lines.extend("| " + " | ".join(row) + " |" for row in rows)
+    return "\n".join(lines)
 
 
 def _write_markdown(path: pathlib.Path, title: str, table: str, notes: str = "") -> None:
@@ -118,23 +135,21 @@ def _load_registry(registry: pathlib.Path, fixtures: pathlib.Path) -> List[Tuple
         conn = sqlite3.connect(sqlite_path)
         try:
             cur = conn.execute("SELECT plan_name, metrics FROM runs")
-            for plan, metrics_json in cur.fetchall():
-                metrics = json.loads(metrics_json)
-                rows.append((plan, metrics))
+            rows = [(plan, _parse_json(metrics_json)) for plan, metrics_json in cur.fetchall()]
         finally:
             conn.close()
     elif csv_path.exists():
         with csv_path.open() as handle:
             reader = csv.DictReader(handle)
             for record in reader:
-                rows.append((record["plan_name"], json.loads(record["metrics"])))
+                rows.append((record["plan_name"], _parse_json(record["metrics"])))
     else:
         fixture = fixtures / "registry.csv"
         if fixture.exists():
             with fixture.open() as handle:
                 reader = csv.DictReader(handle)
                 for record in reader:
-                    rows.append((record["plan_name"], json.loads(record["metrics"])))
+                    rows.append((record["plan_name"], _parse_json(record["metrics"])))
     return rows
 
 
@@ -173,12 +188,17 @@ def main() -> None:
     parser.add_argument("--out", type=pathlib.Path, default=pathlib.Path("dashboards"))
     args = parser.parse_args()
 
-    tables = {
-        "vacua.md": _vacua_dashboard(args.replication, args.expected, args.fixtures),
-        "rg_covariance.md": _rg_dashboard(args.replication, args.expected, args.fixtures),
-        "gaps.md": _gaps_dashboard(args.replication, args.expected, args.fixtures),
-        "ablations.md": _ablations_dashboard(args.registry, args.fixtures),
-    }
+    # The dashboards share no state and mostly wait on file and SQLite reads,
+    # so their inputs are gathered on threads. Every result is collected before
+    # any file is written, so a failing builder leaves the output untouched.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            "vacua.md": executor.submit(_vacua_dashboard, args.replication, args.expected, args.fixtures),
+            "rg_covariance.md": executor.submit(_rg_dashboard, args.replication, args.expected, args.fixtures),
+            "gaps.md": executor.submit(_gaps_dashboard, args.replication, args.expected, args.fixtures),
+            "ablations.md": executor.submit(_ablations_dashboard, args.registry, args.fixtures),
+        }
+        tables = {name: future.result() for name, future in futures.items()}
 
     for name, (table, notes) in tables.items():
         _write_markdown(args.out / name, name.split(".")[0].replace("_", " ").title(), table, notes)
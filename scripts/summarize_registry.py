@@ -8,10 +8,18 @@ import csv
 import json
 import sqlite3
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from statistics import mean, pstdev
 from typing import Any, Dict, Iterable, List, Tuple
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # type: ignore[assignment]
+
+SQLITE_COLUMNS = ("date", "commit", "plan_name", "plan_hash", "job_id", "params", "metrics")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -40,26 +48,28 @@ def load_csv_rows(path: Path) -> List[Dict[str, Any]]:
 def load_sqlite_rows(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
-    rows: List[Dict[str, Any]] = []
     conn = sqlite3.connect(path)
     try:
-        for row in conn.execute(
+        records = conn.execute(
             "SELECT date, \"commit\", plan_name, plan_hash, job_id, params, metrics FROM runs ORDER BY date, plan_name, job_id"
-        ):
-            rows.append(
-                {
-                    "date": row[0],
-                    "commit": row[1],
-                    "plan_name": row[2],
-                    "plan_hash": row[3],
-                    "job_id": row[4],
-                    "params": row[5],
-                    "metrics": row[6],
-                }
-            )
+        ).fetchall()
     finally:
         conn.close()
-    return rows
+    # The metrics column stays a raw JSON string; aggregate() decodes it.
+    return [dict(zip(SQLITE_COLUMNS, record)) for record in records]
+
+
+# Repeated runs of a plan often store identical metrics strings. Cached results
+# are shared between rows, so callers must treat them as read-only.
+@lru_cache(maxsize=4096)
+def parse_metrics(text: str) -> Dict[str, Any]:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib accepts.
+            pass
+    return json.loads(text)
 
 
 def aggregate(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -67,12 +77,13 @@ def aggregate(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     provenance: Dict[str, Tuple[str, str]] = {}
     for row in rows:
         plan = row["plan_name"]
-        data = json.loads(row["metrics"])
+        data = parse_metrics(row["metrics"])
         kpis = data.get("kpis", {})
         provenance.setdefault(plan, (row["date"], row["commit"]))
         for name, payload in kpis.items():
-            buckets[(plan, name)]["values"].append(float(payload.get("value", 0.0)))
-            buckets[(plan, name)]["passes"].append(bool(payload.get("pass", False)))
+            bucket = buckets[(plan, name)]
+            bucket["values"].append(float(payload.get("value", 0.0)))
+            bucket["passes"].append(bool(payload.get("pass", False)))
     summaries: List[Dict[str, Any]] = []
     for (plan, kpi), payload in buckets.items():
         values = payload["values"]
@@ -6,10 +6,17 @@ import hashlib
 import json
 import pathlib
 import zipfile
+from typing import BinaryIO
 
 
-def sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def sha256_stream(handle: BinaryIO) -> str:
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: the read/update loop runs in C.
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: handle.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 def main() -> None:
@@ -20,8 +27,9 @@ def main() -> None:
     with zipfile.ZipFile(args.bundle, "r") as archive:
         manifest = json.loads(archive.read("manifest.json"))
         for artifact in manifest.get("artifacts", []):
-            payload = archive.read(artifact["path"])
-            digest = sha256_bytes(payload)
+            # Hash while decompressing so large members are never held in memory whole.
+            with archive.open(artifact["path"]) as member:
+                digest = sha256_stream(member)
             if digest != artifact["sha256"]:
                 raise SystemExit(
                     f"hash mismatch for {artifact['path']}: expected {artifact['sha256']} got {digest}"
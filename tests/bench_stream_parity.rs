@@ -0,0 +1,57 @@
+use std::process::Command;
+
+use tempfile::tempdir;
+
+// Compares the ijson skeleton used for large bench files with the full parse.
+const PARITY_CHECK: &str = r#"
+import json
+import pathlib
+import sys
+
+sys.path.insert(0, "scripts")
+import collect_results as cr
+
+if cr.ijson is None:
+    print("ijson not installed; streamed path unavailable")
+    raise SystemExit(0)
+
+out = pathlib.Path(sys.argv[1])
+payloads = [
+    {"jobs": [{}, {}, {}], "seconds": 12.0, "summary": {"jobs_per_second": 0.25}},
+    {"jobs": [], "seconds": 4.0, "summary": {"jobs_per_second": 0.5}},
+    {"jobs": 8, "seconds": [1.0], "stats": {"runtime_seconds": 3.0, "throughput": 2.0}},
+    {"jobs": 8, "seconds": [], "elapsed": 2.0},
+    {"jobs": {"count": 3}, "seconds": 2.0, "notes": " nested "},
+    {"samples": [[1, 2], [3]], "summary": {"ops_per_second": 7.0}},
+    [1, 2, 3],
+    [],
+]
+# One payload above the threshold exercises load_bench_payload's own dispatch.
+padded = dict(payloads[0], samples=[0.5] * (cr.STREAM_THRESHOLD_BYTES // 4))
+for index, payload in enumerate(payloads + [padded]):
+    path = out / f"bench_{index}.json"
+    path.write_text(json.dumps(payload))
+    streamed = cr.extract_bench("bench", path, cr._load_json_skeleton(path))
+    parsed = cr.extract_bench("bench", path, cr.load_json(path))
+    assert streamed == parsed, (index, streamed, parsed)
+large = out / f"bench_{len(payloads)}.json"
+assert large.stat().st_size >= cr.STREAM_THRESHOLD_BYTES
+assert cr.extract_bench("bench", large, cr.load_bench_payload(large)) == cr.extract_bench(
+    "bench", large, cr.load_json(large)
+)
+"#;
+
+#[test]
+fn streamed_bench_payloads_match_full_parse() {
+    let temp = tempdir().unwrap();
+    let status = Command::new("python3")
+        .arg("-c")
+        .arg(PARITY_CHECK)
+        .arg(temp.path())
+        .status()
+        .expect("run bench parity check");
+    assert!(
+        status.success(),
+        "streamed bench results diverged from full parse"
+    );
+}